@@ -16,7 +16,6 @@ from typing import List, Dict, Optional, Callable, Any
 from dataclasses import dataclass, field
 from enum import Enum
 from datetime import datetime
-from concurrent.futures import ThreadPoolExecutor, as_completed
 import threading
 import time
 
@@ -131,10 +130,15 @@ class BatchProcessor:
     - Adaptive processing strategies
     """
     
+    # ChromaDB inserts amortise best in batches of roughly 50-250 chunks
+    MIN_STORE_BATCH = 50
+    MAX_STORE_BATCH = 250
+    
     def __init__(
         self,
         document_processor: DocumentProcessor,
-        resource_monitor: Optional[ResourceMonitor] = None
+        resource_monitor: Optional[ResourceMonitor] = None,
+        store_batch_size: int = 200
     ):
         """
         Initialize batch processor.
@@ -142,9 +146,14 @@ class BatchProcessor:
         Args:
             document_processor: DocumentProcessor instance for actual processing
             resource_monitor: Optional resource monitor (uses singleton if not provided)
+            store_batch_size: Chunks accumulated across files before one bulk
+                              vector store write (clamped to 50-250)
         """
         self.processor = document_processor
         self.monitor = resource_monitor or get_resource_monitor()
+        self.store_batch_size = max(
+            self.MIN_STORE_BATCH, min(store_batch_size, self.MAX_STORE_BATCH)
+        )
         
         self._active_batches: Dict[str, BatchProgress] = {}
         self._lock = threading.Lock()
@@ -180,6 +189,9 @@ class BatchProcessor:
         """
         Process a single file with progress tracking.
         
+        Chunks are deferred and written by _flush_pending(), so a file counts
+        as completed once chunked; a failed write later marks it failed.
+        
         Args:
             file_path: Path to document
             file_progress: Progress tracker for this file
@@ -188,34 +200,47 @@ class BatchProcessor:
         Returns:
             ProcessedDocument or None if failed
         """
-        file_progress.status = FileStatus.PROCESSING
-        file_progress.started_at = datetime.now()
-        file_progress.progress_percent = 10.0
+        self._mark_started(file_progress)
         
         try:
             # Process document
-            result = self.processor.ingest(file_path, force=force_reindex)
-            
-            file_progress.progress_percent = 100.0
-            file_progress.status = FileStatus.COMPLETED
-            file_progress.chunks_created = len(result.chunks)
-            file_progress.completed_at = datetime.now()
-            
-            # Track OCR usage from the result
-            file_progress.ocr_used = result.ocr_used
-            file_progress.ocr_pages = result.ocr_pages
-            
-            ocr_info = f", OCR: {result.ocr_pages} pages" if result.ocr_used else ""
-            logger.info(f"Processed {file_progress.filename}: {len(result.chunks)} chunks{ocr_info}")
-            return result
-            
+            result = self.processor.ingest(
+                file_path, force=force_reindex, defer_store=True
+            )
         except Exception as e:
-            file_progress.status = FileStatus.FAILED
-            file_progress.error_message = str(e)
-            file_progress.completed_at = datetime.now()
-            
-            logger.error(f"Failed to process {file_progress.filename}: {e}")
+            self._mark_failed(file_progress, e)
             return None
+        
+        self._mark_completed(file_progress, result)
+        return result
+    
+    def _mark_started(self, file_progress: FileProgress):
+        """Mark a file as being processed."""
+        file_progress.status = FileStatus.PROCESSING
+        file_progress.started_at = datetime.now()
+        file_progress.progress_percent = 10.0
+    
+    def _mark_completed(self, file_progress: FileProgress, result: ProcessedDocument):
+        """Record a successfully chunked file."""
+        file_progress.progress_percent = 100.0
+        file_progress.status = FileStatus.COMPLETED
+        file_progress.chunks_created = len(result.chunks)
+        file_progress.completed_at = datetime.now()
+        
+        # Track OCR usage from the result
+        file_progress.ocr_used = result.ocr_used
+        file_progress.ocr_pages = result.ocr_pages
+        
+        ocr_info = f", OCR: {result.ocr_pages} pages" if result.ocr_used else ""
+        logger.info(f"Processed {file_progress.filename}: {len(result.chunks)} chunks{ocr_info}")
+    
+    def _mark_failed(self, file_progress: FileProgress, error: Exception):
+        """Record a file that failed to process."""
+        file_progress.status = FileStatus.FAILED
+        file_progress.error_message = str(error)
+        file_progress.completed_at = datetime.now()
+        
+        logger.error(f"Failed to process {file_progress.filename}: {error}")
     
     def process_batch_sync(
         self,
@@ -240,13 +265,16 @@ class BatchProcessor:
         file_infos = []
         for path in file_paths:
             p = Path(path)
-            if p.exists():
+            # One stat both checks existence and gives the size
+            try:
                 size_mb = p.stat().st_size / (1024 * 1024)
-                file_infos.append({
-                    "path": str(p),
-                    "size_mb": size_mb,
-                    "type": p.suffix.lower()
-                })
+            except OSError:
+                continue
+            file_infos.append({
+                "path": str(p),
+                "size_mb": size_mb,
+                "type": p.suffix.lower()
+            })
         
         if not file_infos:
             return BatchProgress(
@@ -301,6 +329,7 @@ class BatchProcessor:
         callback: Optional[Callable]
     ):
         """Process files one at a time."""
+        pending = []
         for file_progress in batch.files:
             result = self._process_single_file(
                 file_progress.file_path,
@@ -311,11 +340,17 @@ class BatchProcessor:
             if result:
                 batch.completed_files += 1
                 batch.total_chunks += len(result.chunks)
+                pending.append((file_progress, result))
             else:
                 batch.failed_files += 1
             
+            if self.processor.pending_chunk_count >= self.store_batch_size:
+                self._flush_pending(batch, pending)
+            
             if callback:
                 callback(batch)
+        
+        self._flush_pending(batch, pending)
     
     def _process_parallel(
         self,
@@ -324,38 +359,72 @@ class BatchProcessor:
         force_reindex: bool,
         callback: Optional[Callable]
     ):
-        """Process files in parallel with limited workers."""
-        with ThreadPoolExecutor(max_workers=worker_count) as executor:
-            # Submit all tasks
-            future_to_progress = {
-                executor.submit(
-                    self._process_single_file,
-                    fp.file_path,
-                    fp,
-                    force_reindex
-                ): fp
-                for fp in batch.files
-            }
+        """
+        Process files in parallel with limited workers.
+        
+        Extraction (PDF parsing, OCR) runs in worker processes, sidestepping
+        the GIL; chunking, embedding and storage stay in this process where
+        the model and vector store are already loaded.
+        """
+        # Progress trackers per path; a path listed twice yields twice
+        progress_by_path: Dict[str, List[FileProgress]] = {}
+        for file_progress in batch.files:
+            self._mark_started(file_progress)
+            progress_by_path.setdefault(file_progress.file_path, []).append(file_progress)
+        
+        pending = []
+        results = self.processor.iter_ingest_parallel(
+            [fp.file_path for fp in batch.files],
+            max_workers=worker_count,
+            force=force_reindex
+        )
+        for file_path, result in results:
+            file_progress = progress_by_path[file_path].pop(0)
+            
+            if isinstance(result, Exception):
+                self._mark_failed(file_progress, result)
+                batch.failed_files += 1
+            else:
+                self._mark_completed(file_progress, result)
+                batch.completed_files += 1
+                batch.total_chunks += len(result.chunks)
+                pending.append((file_progress, result))
+            
+            if self.processor.pending_chunk_count >= self.store_batch_size:
+                self._flush_pending(batch, pending)
             
-            # Collect results as they complete
-            for future in as_completed(future_to_progress):
-                file_progress = future_to_progress[future]
-                
-                try:
-                    result = future.result()
-                    if result:
-                        batch.completed_files += 1
-                        batch.total_chunks += len(result.chunks)
-                    else:
-                        batch.failed_files += 1
-                except Exception as e:
-                    batch.failed_files += 1
-                    file_progress.status = FileStatus.FAILED
-                    file_progress.error_message = str(e)
-                    logger.error(f"Parallel processing error: {e}")
-                
-                if callback:
-                    callback(batch)
+            if callback:
+                callback(batch)
+        
+        self._flush_pending(batch, pending)
+    
+    def _flush_pending(self, batch: BatchProgress, pending: List):
+        """
+        Bulk-write deferred chunks and fail files whose write did not land.
+        
+        Args:
+            batch: Batch progress to correct on failure
+            pending: (FileProgress, ProcessedDocument) pairs completed since
+                     the last flush; cleared on return
+        """
+        error = None
+        try:
+            self.processor.flush()
+        except Exception as e:
+            error = e
+            logger.error(f"Failed to store batch chunks: {e}")
+        
+        # A failed flush (here or an automatic one inside ingest) drops the
+        # affected documents from processed_docs
+        reason = f"Failed to store chunks: {error}" if error else "Failed to store chunks"
+        for file_progress, result in pending:
+            if result.doc_hash not in self.processor.processed_docs:
+                file_progress.status = FileStatus.FAILED
+                file_progress.error_message = reason
+                batch.completed_files -= 1
+                batch.failed_files += 1
+                batch.total_chunks -= len(result.chunks)
+        pending.clear()
     
     async def process_batch_async(
         self,
@@ -7,10 +7,23 @@ No internet required - fully offline operation.
 """
 
 import os
+import re
+import bisect
 import hashlib
 import logging
+import multiprocessing
+import queue
+import sqlite3
+import threading
+import time
+import zipfile
+from concurrent.futures import (
+    FIRST_COMPLETED, Future, ProcessPoolExecutor, ThreadPoolExecutor, wait
+)
+from concurrent.futures.process import BrokenProcessPool
+from collections import OrderedDict, deque
 from pathlib import Path
-from typing import List, Dict, Optional, Union
+from typing import TYPE_CHECKING, Iterator, List, Dict, Optional, Tuple, Union
 from dataclasses import dataclass, field
 from enum import Enum
 from datetime import datetime
@@ -22,6 +35,14 @@ import openpyxl
 from PIL import Image
 import pytesseract
 
+# lxml ships with python-docx; used to stream document.xml without building
+# the python-docx object tree
+try:
+    from lxml import etree
+    LXML_AVAILABLE = True
+except ImportError:
+    LXML_AVAILABLE = False
+
 # OCR Processing Pipeline (pre/post-processing for artifact handling)
 try:
     from ocr_processor import OCRPipeline, preprocess_image, postprocess_text
@@ -30,13 +51,14 @@ except ImportError:
     OCR_PIPELINE_AVAILABLE = False
 
 # Chunking & Embeddings
-from sentence_transformers import SentenceTransformer
+import numpy as np
 
-# Python 3.14 compatibility patch for ChromaDB
-import chromadb_compat  # noqa: F401 - side-effect import for patching
-
-import chromadb
-from chromadb.config import Settings
+# sentence-transformers pulls in torch, so it is imported when the embedding
+# model is first loaded; extraction workers and CLI paths never pay for it.
+# ChromaDB is likewise imported by LocalVectorStore, keeping it out of the
+# extraction worker processes, which import this module on spawn.
+if TYPE_CHECKING:
+    from sentence_transformers import SentenceTransformer
 
 logger = logging.getLogger(__name__)
 
@@ -90,17 +112,52 @@ class ProcessedDocument:
 class DocumentExtractor:
     """Handles raw text extraction from various document formats."""
     
-    SUPPORTED_IMAGES = {'.png', '.jpg', '.jpeg', '.tiff', '.bmp', '.gif', '.webp'}
-    SUPPORTED_DOCS = {'.pdf', '.docx', '.doc', '.xlsx', '.xls', '.txt', '.md', '.csv'}
+    SUPPORTED_IMAGES = frozenset({'.png', '.jpg', '.jpeg', '.tiff', '.bmp', '.gif', '.webp'})
+    SUPPORTED_DOCS = frozenset({'.pdf', '.docx', '.doc', '.xlsx', '.xls', '.txt', '.md', '.csv'})
+    SUPPORTED_EXTENSIONS = SUPPORTED_IMAGES | SUPPORTED_DOCS
+    
+    # Concurrent tesseract runs per PDF by default. Each run starts its own
+    # OpenMP threads, and the server process cannot cap them (see
+    # _init_extract_worker), so more runs would oversubscribe the CPU
+    DEFAULT_OCR_WORKERS = 2
     
-    def __init__(self, tesseract_path: Optional[str] = None):
+    def __init__(
+        self,
+        tesseract_path: Optional[str] = None,
+        max_text_bytes: int = 200 * 1024 * 1024,
+        ocr_workers: Optional[int] = None
+    ):
         """
         Initialize extractor.
         
         Args:
             tesseract_path: Path to tesseract executable (e.g., 
                            "C:/Program Files/Tesseract-OCR/tesseract.exe" on Windows)
+            max_text_bytes: Largest .txt/.md file accepted; bigger files are
+                            rejected before being read into memory
+            ocr_workers: Scanned PDF pages OCR'd concurrently
+                         (default: DEFAULT_OCR_WORKERS)
         """
+        self.max_text_bytes = max_text_bytes
+        self.ocr_workers = ocr_workers or min(self.DEFAULT_OCR_WORKERS, os.cpu_count() or 1)
+        
+        # Suffix dispatch tables, bound once rather than rebuilt per file
+        # Methods that return OCR metadata
+        self._ocr_extractors = {
+            '.pdf': self._extract_pdf,
+        }
+        
+        # Methods that don't use OCR (return just text)
+        self._text_extractors = {
+            '.docx': self._extract_docx,
+            '.doc': self._extract_doc_legacy,
+            '.xlsx': self._extract_xlsx,
+            '.xls': self._extract_xlsx,
+            '.txt': self._extract_txt,
+            '.md': self._extract_txt,
+            '.csv': self._extract_csv,
+        }
+        
         if tesseract_path:
             pytesseract.pytesseract.tesseract_cmd = tesseract_path
         
@@ -116,9 +173,34 @@ class DocumentExtractor:
             return False
     
     @classmethod
-    def get_supported_extensions(cls) -> set:
+    def get_supported_extensions(cls) -> frozenset:
         """Return all supported file extensions."""
-        return cls.SUPPORTED_IMAGES | cls.SUPPORTED_DOCS
+        return cls.SUPPORTED_EXTENSIONS
+    
+    # Leading bytes of formats that are commonly saved under a .doc name
+    _MAGIC_SUFFIXES = (
+        (b'%PDF', '.pdf'),
+        (b'PK\x03\x04', '.docx'),  # OOXML zip container
+    )
+    
+    @classmethod
+    def sniff_suffix(cls, path: Path) -> Optional[str]:
+        """
+        Identify a file's real format from its first bytes.
+        
+        Returns:
+            Matching extension (e.g. '.docx'), or None for anything else,
+            including genuine legacy OLE .doc files
+        """
+        try:
+            with open(path, 'rb') as f:
+                head = f.read(8)
+        except OSError:
+            return None
+        for magic, suffix in cls._MAGIC_SUFFIXES:
+            if head.startswith(magic):
+                return suffix
+        return None
     
     def extract(self, file_path: Path) -> str:
         """
@@ -138,28 +220,15 @@ class DocumentExtractor:
             raise FileNotFoundError(f"File not found: {file_path}")
         
         suffix = file_path.suffix.lower()
+        if suffix == '.doc':
+            # Renamed .docx/.pdf files don't need the legacy converter
+            suffix = self.sniff_suffix(file_path) or suffix
         
-        # Methods that return OCR metadata
-        ocr_extractors = {
-            '.pdf': self._extract_pdf,
-        }
-        
-        # Methods that don't use OCR (return just text)
-        text_extractors = {
-            '.docx': self._extract_docx,
-            '.doc': self._extract_doc_legacy,
-            '.xlsx': self._extract_xlsx,
-            '.xls': self._extract_xlsx,
-            '.txt': self._extract_txt,
-            '.md': self._extract_txt,
-            '.csv': self._extract_csv,
-        }
-        
-        if suffix in ocr_extractors:
-            return ocr_extractors[suffix](file_path)
-        elif suffix in text_extractors:
+        if suffix in self._ocr_extractors:
+            return self._ocr_extractors[suffix](file_path)
+        elif suffix in self._text_extractors:
             # Wrap result in tuple with OCR=False
-            text = text_extractors[suffix](file_path)
+            text = self._text_extractors[suffix](file_path)
             return text, False, 0
         elif suffix in self.SUPPORTED_IMAGES:
             return self._extract_image_ocr(file_path)
@@ -187,27 +256,45 @@ class DocumentExtractor:
         if OCR_PIPELINE_AVAILABLE and self._tesseract_available:
             ocr_pipeline = OCRPipeline()
 
-        for page_num, page in enumerate(doc):
-            text = page.get_text()
+        # Pages are rendered in order (a fitz document is not thread-safe) and
+        # OCR'd on a thread pool; tesseract runs as a subprocess, so pages
+        # overlap fully. At most two renders per worker wait in memory.
+        pages: List[Tuple[int, str, bool, Optional[Future]]] = []
+        in_flight: deque = deque()
+        with ThreadPoolExecutor(max_workers=self.ocr_workers) as pool:
+            for page_num, page in enumerate(doc):
+                text = page.get_text()
+                needs_ocr = len(text.strip()) < 50 and self._tesseract_available
+                future = None
 
-            # If page has minimal text, attempt OCR with pre/post processing
-            if len(text.strip()) < 50 and self._tesseract_available:
-                try:
-                    # Render page to image at higher DPI for better OCR
-                    pix = page.get_pixmap(dpi=200)
-                    img = Image.frombytes("RGB", [pix.width, pix.height], pix.samples)
+                # If page has minimal text, attempt OCR with pre/post processing
+                if needs_ocr:
+                    try:
+                        # Render page to image at higher DPI for better OCR; OCR
+                        # preprocessing converts to grayscale anyway, so render
+                        # one channel instead of three
+                        pix = page.get_pixmap(dpi=200, colorspace=fitz.csGRAY, alpha=False)
+                        img = Image.frombytes("L", [pix.width, pix.height], pix.samples)
+                        future = pool.submit(self._ocr_page, img, ocr_pipeline)
+                        in_flight.append(future)
+                    except Exception as e:
+                        logger.warning(f"OCR failed for page {page_num + 1}: {e}")
+
+                pages.append((page_num, text, needs_ocr, future))
 
-                    if ocr_pipeline:
-                        # Full pipeline: preprocess -> OCR -> postprocess
-                        ocr_text, metadata = ocr_pipeline.process_image(img)
+                if len(in_flight) > 2 * self.ocr_workers:
+                    in_flight.popleft().exception()
+
+        for page_num, text, needs_ocr, future in pages:
+            if future is not None:
+                try:
+                    ocr_text, metadata = future.result()
+                    if metadata:
                         logger.debug(
                             f"OCR page {page_num + 1}: "
                             f"{metadata['raw_length']} -> {metadata['clean_length']} chars "
                             f"({metadata['reduction_pct']}% reduction)"
                         )
-                    else:
-                        # Fallback: basic OCR without pre/post processing
-                        ocr_text = pytesseract.image_to_string(img)
 
                     if ocr_text.strip():
                         text = f"[OCR]\n{ocr_text}"
@@ -216,7 +303,7 @@ class DocumentExtractor:
                         logger.debug(f"OCR applied to page {page_num + 1}")
                 except Exception as e:
                     logger.warning(f"OCR failed for page {page_num + 1}: {e}")
-            elif text.strip() and OCR_PIPELINE_AVAILABLE:
+            elif text.strip() and not needs_ocr and OCR_PIPELINE_AVAILABLE:
                 # Even for native text, apply post-processing to clean up
                 text = postprocess_text(text)
 
@@ -226,25 +313,152 @@ class DocumentExtractor:
         doc.close()
         return "\n\n".join(text_parts), ocr_used, ocr_page_count
     
+    def _ocr_page(
+        self,
+        img: "Image.Image",
+        ocr_pipeline: Optional["OCRPipeline"]
+    ) -> Tuple[str, Optional[dict]]:
+        """OCR one rendered PDF page (runs on the OCR thread pool)."""
+        if ocr_pipeline:
+            # Full pipeline: preprocess -> OCR -> postprocess
+            return ocr_pipeline.process_image(img)
+        # Fallback: basic OCR without pre/post processing
+        return pytesseract.image_to_string(img), None
+    
+    _W_NS = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+    _W_BODY = _W_NS + "body"
+    _W_P = _W_NS + "p"
+    _W_R = _W_NS + "r"
+    _W_T = _W_NS + "t"
+    _W_TBL = _W_NS + "tbl"
+    _W_TR = _W_NS + "tr"
+    _W_TC = _W_NS + "tc"
+    _W_HYPERLINK = _W_NS + "hyperlink"
+    _W_VAL = _W_NS + "val"
+    _W_TYPE = _W_NS + "type"
+    _W_RUN_TEXT = {
+        _W_NS + "tab": "\t",
+        _W_NS + "ptab": "\t",
+        _W_NS + "cr": "\n",
+        _W_NS + "noBreakHyphen": "-",
+    }
+
     def _extract_docx(self, path: Path) -> str:
-        """Extract text from DOCX."""
+        """Extract text from DOCX.
+
+        Streams word/document.xml with lxml when available and falls back to
+        python-docx for anything the fast path cannot read.
+        """
+        if LXML_AVAILABLE:
+            try:
+                return self._extract_docx_fast(path)
+            except (KeyError, zipfile.BadZipFile, etree.XMLSyntaxError) as e:
+                logger.debug(f"DOCX fast path failed for {path.name}, using python-docx: {e}")
+
         doc = DocxDocument(path)
-        paragraphs = []
-        
-        for para in doc.paragraphs:
-            if para.text.strip():
-                paragraphs.append(para.text.strip())
+        # .text walks the runs on every access, so read each one once
+        paragraphs = [text for text in (p.text.strip() for p in doc.paragraphs) if text]
         
         # Also extract from tables
         for table in doc.tables:
             for row in table.rows:
                 row_text = " | ".join(
-                    cell.text.strip() for cell in row.cells if cell.text.strip()
+                    text for text in (cell.text.strip() for cell in row.cells) if text
                 )
                 if row_text:
                     paragraphs.append(row_text)
         
         return "\n\n".join(paragraphs)
+
+    def _extract_docx_fast(self, path: Path) -> str:
+        """Extract DOCX text by iterparsing document.xml.
+
+        Produces the same output as the python-docx path (body paragraphs
+        first, then table rows) while clearing each body element once it has
+        been read, so memory stays flat on large documents.
+        """
+        paragraphs = []
+        rows = []
+
+        with zipfile.ZipFile(path) as zf, zf.open("word/document.xml") as xml:
+            for _, elem in etree.iterparse(xml, events=("end",), tag=(self._W_P, self._W_TBL)):
+                parent = elem.getparent()
+                if parent is None or parent.tag != self._W_BODY:
+                    continue
+
+                if elem.tag == self._W_P:
+                    text = self._docx_paragraph_text(elem).strip()
+                    if text:
+                        paragraphs.append(text)
+                else:
+                    rows.extend(self._docx_table_rows(elem))
+
+                elem.clear()
+                while elem.getprevious() is not None:
+                    del parent[0]
+
+        return "\n\n".join(paragraphs + rows)
+
+    def _docx_run_text(self, run) -> str:
+        """Text of a <w:r> element, mirroring python-docx Run.text."""
+        parts = []
+        for child in run:
+            tag = child.tag
+            if tag == self._W_T:
+                parts.append(child.text or "")
+            elif tag == self._W_NS + "br":
+                if child.get(self._W_TYPE, "textWrapping") == "textWrapping":
+                    parts.append("\n")
+            else:
+                text = self._W_RUN_TEXT.get(tag)
+                if text:
+                    parts.append(text)
+        return "".join(parts)
+
+    def _docx_paragraph_text(self, para) -> str:
+        """Text of a <w:p> element, mirroring python-docx Paragraph.text."""
+        parts = []
+        for child in para:
+            if child.tag == self._W_R:
+                parts.append(self._docx_run_text(child))
+            elif child.tag == self._W_HYPERLINK:
+                parts.extend(self._docx_run_text(r) for r in child.iterchildren(self._W_R))
+        return "".join(parts)
+
+    def _docx_table_rows(self, table) -> List[str]:
+        """Row strings of a <w:tbl>, with horizontal and vertical merges resolved."""
+        rows = []
+        above: Dict[int, str] = {}
+
+        for tr in table.iterchildren(self._W_TR):
+            grid_before = tr.find(f"{self._W_NS}trPr/{self._W_NS}gridBefore")
+            offset = int(grid_before.get(self._W_VAL, 0)) if grid_before is not None else 0
+            cells = []
+            current: Dict[int, str] = {}
+
+            for tc in tr.iterchildren(self._W_TC):
+                grid_span = tc.find(f"{self._W_NS}tcPr/{self._W_NS}gridSpan")
+                span = int(grid_span.get(self._W_VAL, 1)) if grid_span is not None else 1
+                v_merge = tc.find(f"{self._W_NS}tcPr/{self._W_NS}vMerge")
+
+                if v_merge is not None and v_merge.get(self._W_VAL, "continue") == "continue":
+                    text = above.get(offset, "")
+                else:
+                    text = "\n".join(
+                        self._docx_paragraph_text(p) for p in tc.iterchildren(self._W_P)
+                    )
+
+                for i in range(span):
+                    current[offset + i] = text
+                    cells.append(text)
+                offset += span
+
+            above = current
+            row_text = " | ".join(c.strip() for c in cells if c.strip())
+            if row_text:
+                rows.append(row_text)
+
+        return rows
     
     def _extract_doc_legacy(self, path: Path) -> str:
         """
@@ -291,33 +505,77 @@ class DocumentExtractor:
     
     def _extract_txt(self, path: Path) -> str:
         """Extract text from plain text file."""
+        size = path.stat().st_size
+        if size > self.max_text_bytes:
+            raise ValueError(
+                f"Text file too large: {path.name} is {size / (1024 * 1024):.0f} MB "
+                f"(limit {self.max_text_bytes / (1024 * 1024):.0f} MB)"
+            )
+        
+        # Read once; each fallback encoding decodes the same bytes in C
+        data = path.read_bytes()
         encodings = ['utf-8', 'utf-16', 'latin-1', 'cp1252']
         
         for encoding in encodings:
+            # Without a BOM, utf-16 turns any even-length input into garbage
+            if encoding == 'utf-16' and not data.startswith((b'\xff\xfe', b'\xfe\xff')):
+                continue
             try:
-                return path.read_text(encoding=encoding)
+                text = data.decode(encoding)
+                break
             except UnicodeDecodeError:
                 continue
+        else:
+            # Last resort: ignore errors
+            text = data.decode('utf-8', errors='replace')
         
-        # Last resort: ignore errors
-        return path.read_text(encoding='utf-8', errors='replace')
+        # Match the universal-newline translation text-mode reads applied
+        if '\r' in text:
+            text = text.replace('\r\n', '\n').replace('\r', '\n')
+        return text
     
-    def _extract_csv(self, path: Path) -> str:
-        """Extract text from CSV file."""
-        import csv
-        
-        text = self._extract_txt(path)
-        lines = text.strip().split('\n')
+    def _extract_csv(self, path: Path, max_rows: int = 1000) -> str:
+        """
+        Extract text from CSV file.
+
+        Only the first ``max_rows`` lines are indexed, so the file is read
+        line by line and never loaded whole.
+        """
+        encodings = ['utf-8', 'utf-16', 'latin-1', 'cp1252']
         
-        if not lines:
-            return ""
+        for encoding in encodings:
+            try:
+                return self._read_csv_rows(path, encoding, 'strict', max_rows)
+            except UnicodeError:
+                continue
         
-        # Format as table
+        # Last resort: ignore errors
+        return self._read_csv_rows(path, 'utf-8', 'replace', max_rows)
+    
+    @staticmethod
+    def _read_csv_rows(path: Path, encoding: str, errors: str, max_rows: int) -> str:
+        """Read up to max_rows lines of a CSV file and format them as a table."""
         formatted = []
-        for line in lines[:1000]:  # Limit to first 1000 rows
-            formatted.append(line.replace(',', ' | '))
-        
-        return "\n".join(formatted)
+        more_rows = False
+        with open(path, 'r', encoding=encoding, errors=errors) as f:
+            for line in f:
+                # Same result as text.strip() on the whole file: leading blank
+                # lines are skipped and the first row loses its indentation
+                if not formatted:
+                    line = line.lstrip()
+                    if not line:
+                        continue
+                formatted.append(line.rstrip('\n'))
+                if len(formatted) >= max_rows:
+                    # Trailing whitespace is only stripped at the end of the file
+                    more_rows = any(rest.strip() for rest in f)
+                    break
+        
+        # Strip before formatting: a trailing ',' keeps the space of its ' | '
+        text = "\n".join(formatted)
+        if not more_rows:
+            text = text.rstrip()
+        return text.replace(',', ' | ')
     
     def _extract_image_ocr(self, path: Path) -> tuple[str, bool, int]:
         """
@@ -361,6 +619,35 @@ class DocumentExtractor:
         return text, True, 1
 
 
+# Per-process extractor reused by _extract_in_worker across tasks
+_worker_extractor: Optional[DocumentExtractor] = None
+
+
+def _init_extract_worker():
+    """
+    Process-pool initializer for extraction workers.
+    
+    Several workers run tesseract at once, and each tesseract would otherwise
+    start one OpenMP thread per core. The limit is set only here: in the main
+    process it would also cap the torch encoder, which reads the same variable.
+    """
+    os.environ.setdefault("OMP_THREAD_LIMIT", "1")
+
+
+def _extract_in_worker(file_path: str, tesseract_path: Optional[str]) -> tuple[str, bool, int]:
+    """
+    Process-pool entry point for parallel extraction.
+    
+    Module-level so it pickles under the spawn start method. Each worker
+    builds its extractor once and reuses it for every file it receives.
+    """
+    global _worker_extractor
+    if _worker_extractor is None:
+        # Files already run one per process; threading pages on top would oversubscribe
+        _worker_extractor = DocumentExtractor(tesseract_path=tesseract_path, ocr_workers=1)
+    return _worker_extractor.extract(Path(file_path))
+
+
 class SemanticChunker:
     """
     Token-aware semantic chunking optimized for large context windows.
@@ -369,6 +656,12 @@ class SemanticChunker:
     relevant chunks while preserving context.
     """
     
+    # Preferred split points: ". " ".\n" ".\t" "? " "?\n" "! " "!\n" "\n\n".
+    # All are two characters; the lookahead also reports overlapping
+    # matches such as ".\n" and "\n\n" inside ".\n\n".
+    _BOUNDARY_RE = re.compile(r'(?=\.[ \n\t]|[?!][ \n]|\n\n)')
+    _BOUNDARY_LEN = 2
+    
     def __init__(
         self,
         chunk_size: int = 1000,       # target tokens per chunk
@@ -396,6 +689,9 @@ class SemanticChunker:
         char_chunk_size = int(self.chunk_size * self.chars_per_token)
         char_overlap = int(self.chunk_overlap * self.chars_per_token)
         
+        # One regex pass finds every boundary; each chunk then bisects
+        boundaries = [m.start() for m in self._BOUNDARY_RE.finditer(text)]
+        
         chunks = []
         start = 0
         chunk_index = 0
@@ -405,7 +701,7 @@ class SemanticChunker:
             
             # Try to break at sentence boundary
             if end < len(text):
-                boundary = self._find_sentence_boundary(text, end)
+                boundary = self._find_sentence_boundary(text, end, boundaries=boundaries)
                 if boundary > start + (char_chunk_size // 2):  # Ensure minimum chunk size
                     end = boundary
             
@@ -431,26 +727,223 @@ class SemanticChunker:
         
         return chunks
     
-    def _find_sentence_boundary(self, text: str, pos: int, window: int = 200) -> int:
-        """Find nearest sentence boundary near position."""
+    def _find_sentence_boundary(
+        self,
+        text: str,
+        pos: int,
+        window: int = 200,
+        boundaries: Optional[List[int]] = None
+    ) -> int:
+        """
+        Find nearest sentence boundary before position.
+        
+        Args:
+            text: Full document text
+            pos: Target split position
+            window: How far back to look for a boundary
+            boundaries: Sorted boundary start offsets from _BOUNDARY_RE
+                        (computed for the whole text when omitted)
+        """
         search_start = max(0, pos - window)
-        search_end = min(len(text), pos + window)
         
-        # Priority order for sentence boundaries
-        boundaries = ['. ', '.\n', '.\t', '? ', '!\n', '?\n', '! ', '\n\n']
+        if boundaries is None:
+            boundaries = [m.start() for m in self._BOUNDARY_RE.finditer(text)]
+        
+        # Last boundary that ends at or before pos
+        i = bisect.bisect_right(boundaries, pos - self._BOUNDARY_LEN) - 1
+        if i >= 0 and boundaries[i] > search_start:
+            return boundaries[i] + self._BOUNDARY_LEN
+        
+        return pos
+
+
+class EmbeddingCache:
+    """
+    SQLite-backed cache of chunk embeddings keyed by model and content hash.
+    
+    Re-indexing unchanged documents (or documents sharing boilerplate) reuses
+    stored vectors instead of re-running the encoder. Vectors are stored as
+    float16 to halve disk use; cosine ranking is unaffected at that precision.
+    """
+    
+    # Stay under SQLite's bound-parameter limit for IN (...) lookups
+    _LOOKUP_BATCH = 500
+    _WORD_RE = re.compile(r"\w+")
+    
+    def __init__(
+        self,
+        db_path: str,
+        model_name: str,
+        near_duplicate_bits: int = 0,
+        near_duplicate_window: int = 4096
+    ):
+        """
+        Initialize embedding cache.
+        
+        Args:
+            db_path: SQLite database file (created if missing)
+            model_name: Embedding model identity (name and backend), part
+                        of every cache key
+            near_duplicate_bits: Max SimHash Hamming distance at which a
+                                 recently embedded chunk's vector is reused
+                                 for a new chunk (0 = exact matches only)
+            near_duplicate_window: Recent vectors kept for near-duplicate lookup
+        """
+        self.model_name = model_name
+        self.near_duplicate_bits = near_duplicate_bits
+        self._recent: deque = deque(maxlen=near_duplicate_window)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS embeddings (key BLOB PRIMARY KEY, vec BLOB NOT NULL)"
+        )
+        self._conn.commit()
+    
+    def _key(self, text: str) -> bytes:
+        """Cache key: 128-bit BLAKE2b of model name + chunk text."""
+        return hashlib.blake2b(
+            f"{self.model_name}\x00{text}".encode("utf-8"),
+            digest_size=16
+        ).digest()
+    
+    @classmethod
+    def simhash(cls, text: str) -> int:
+        """64-bit SimHash over lower-cased words; similar texts differ in few bits."""
+        words = cls._WORD_RE.findall(text.lower())
+        if not words:
+            return 0
+        
+        hashes = np.array(
+            [
+                int.from_bytes(hashlib.blake2b(w.encode("utf-8"), digest_size=8).digest(), "little")
+                for w in words
+            ],
+            dtype=np.uint64
+        )
+        bits = np.unpackbits(hashes.view(np.uint8).reshape(-1, 8), axis=1, bitorder="little")
+        majority = bits.sum(axis=0) * 2 > len(words)
+        return int.from_bytes(np.packbits(majority, bitorder="little").tobytes(), "little")
+    
+    def _find_near_duplicate(self, signature: int) -> Optional[np.ndarray]:
+        """Return the closest recent vector within near_duplicate_bits, if any."""
+        best_vec, best_dist = None, self.near_duplicate_bits + 1
+        for recent_sig, vec in self._recent:
+            dist = (recent_sig ^ signature).bit_count()
+            if dist < best_dist:
+                best_vec, best_dist = vec, dist
+        return best_vec
+    
+    def lookup(self, texts: List[str]) -> List[Optional[np.ndarray]]:
+        """Return cached float32 vectors for texts (None where missing)."""
+        keys = [self._key(t) for t in texts]
+        found = {}
+        
+        with self._lock:
+            for start in range(0, len(keys), self._LOOKUP_BATCH):
+                batch = keys[start:start + self._LOOKUP_BATCH]
+                placeholders = ",".join("?" * len(batch))
+                rows = self._conn.execute(
+                    f"SELECT key, vec FROM embeddings WHERE key IN ({placeholders})",
+                    batch
+                )
+                for key, vec in rows:
+                    found[key] = np.frombuffer(vec, dtype=np.float16).astype(np.float32)
         
-        best_pos = pos
-        best_distance = window
+        vectors = [found.get(k) for k in keys]
         
-        for boundary in boundaries:
-            idx = text.rfind(boundary, search_start, pos)
-            if idx > search_start:
-                distance = pos - idx
-                if distance < best_distance:
-                    best_pos = idx + len(boundary)
-                    best_distance = distance
+        if self.near_duplicate_bits > 0:
+            with self._lock:
+                for i, vec in enumerate(vectors):
+                    if vec is None:
+                        vectors[i] = self._find_near_duplicate(self.simhash(texts[i]))
         
-        return best_pos
+        return vectors
+    
+    def store(self, texts: List[str], vectors: np.ndarray):
+        """Cache vectors for texts (existing entries are kept)."""
+        rows = [
+            (self._key(t), np.asarray(v, dtype=np.float16).tobytes())
+            for t, v in zip(texts, vectors)
+        ]
+        with self._lock:
+            self._conn.executemany(
+                "INSERT OR IGNORE INTO embeddings (key, vec) VALUES (?, ?)", rows
+            )
+            self._conn.commit()
+            
+            if self.near_duplicate_bits > 0:
+                for t, v in zip(texts, vectors):
+                    self._recent.append((self.simhash(t), np.asarray(v, dtype=np.float32)))
+
+
+class QueryCache:
+    """
+    In-process LRU cache of recent query results with a TTL.
+    
+    An exact repeat of a query skips both the encoder and the ChromaDB search;
+    a paraphrase whose embedding is at least ``similarity`` (cosine) to a
+    cached query with the same n_results/filter skips the search. The owning
+    store clears the cache whenever the collection changes.
+    """
+    
+    def __init__(self, max_entries: int = 256, ttl: float = 300.0, similarity: float = 0.95):
+        """
+        Initialize query cache.
+        
+        Args:
+            max_entries: Cached queries kept before evicting the least recent
+            ttl: Seconds a cached result stays valid
+            similarity: Min cosine similarity for a paraphrase to hit
+        """
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.similarity = similarity
+        # (query_text, n_results, filter) -> (unit embedding, results, expires_at)
+        self._entries: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+    
+    def get(self, key: Tuple) -> Optional[List[Dict]]:
+        """Return results cached for exactly this query, or None."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if entry[2] < time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return list(entry[1])
+    
+    def get_similar(self, key: Tuple, embedding: np.ndarray) -> Optional[List[Dict]]:
+        """Return results of the closest cached paraphrase of this query, or None."""
+        now = time.monotonic()
+        with self._lock:
+            candidates = [
+                (k, entry) for k, entry in self._entries.items()
+                if k[1:] == key[1:] and entry[2] >= now
+            ]
+            if not candidates:
+                return None
+            scores = np.stack([entry[0] for _, entry in candidates]) @ embedding
+            best = int(np.argmax(scores))
+            if scores[best] < self.similarity:
+                return None
+            best_key, entry = candidates[best]
+            self._entries.move_to_end(best_key)
+            return list(entry[1])
+    
+    def put(self, key: Tuple, embedding: np.ndarray, results: List[Dict]):
+        """Cache results for a query, evicting the least recently used entry."""
+        with self._lock:
+            self._entries[key] = (embedding, results, time.monotonic() + self.ttl)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+    
+    def clear(self):
+        """Drop all cached results."""
+        with self._lock:
+            self._entries.clear()
 
 
 class LocalVectorStore:
@@ -460,11 +953,26 @@ class LocalVectorStore:
     Fully offline - uses local sentence-transformers model.
     """
     
+    # embedding_backend option -> (sentence-transformers backend, model_kwargs).
+    # onnx-int8 loads the dynamically quantized export published alongside the
+    # sentence-transformers models; that build needs an AVX2-capable x86-64 CPU.
+    _BACKENDS = {
+        "onnx": ("onnx", None),
+        "onnx-int8": ("onnx", {"file_name": "onnx/model_quint8_avx2.onnx"}),
+        "openvino": ("openvino", None),
+    }
+    
     def __init__(
         self,
         persist_directory: Optional[str] = None,
         embedding_model: str = "all-MiniLM-L6-v2",
-        collection_name: str = "jan_documents"
+        collection_name: str = "jan_documents",
+        embed_batch_size: Optional[int] = None,
+        near_duplicate_bits: int = 0,
+        query_cache_size: int = 256,
+        write_batch_size: int = 512,
+        embedding_backend: str = "torch",
+        cache_dir: Optional[str] = None
     ):
         """
         Initialize vector store.
@@ -473,9 +981,30 @@ class LocalVectorStore:
             persist_directory: Path for persistent storage (None for ephemeral)
             embedding_model: sentence-transformers model name
             collection_name: ChromaDB collection name
+            embed_batch_size: Chunks per encoder forward pass
+                             (None = 32 on CPU, 128 on CUDA)
+            near_duplicate_bits: SimHash distance for reusing a near-identical
+                                 chunk's embedding (0 = off; needs a cache)
+            query_cache_size: Recent query results kept in memory (0 = off)
+            write_batch_size: Chunks embedded and written per collection.add()
+            embedding_backend: Inference backend: "torch", "onnx",
+                               "onnx-int8" (quantized, CPU) or "openvino"
+            cache_dir: Directory for the on-disk embedding cache
+                       (None = persist_directory; no cache when both are None)
         """
-        logger.info(f"Loading embedding model: {embedding_model}")
-        self.embedder = SentenceTransformer(embedding_model)
+        # The model is loaded on first use so that stats, listing and
+        # deletion never pay the torch + model load cost
+        self.embedding_model = embedding_model
+        self.embedding_backend = embedding_backend
+        self._embedder = None
+        self._embedder_lock = threading.Lock()
+        self._embed_batch_size = embed_batch_size
+        self.write_batch_size = write_batch_size
+        
+        # Python 3.14 compatibility patch for ChromaDB
+        import chromadb_compat  # noqa: F401 - side-effect import for patching
+        import chromadb
+        from chromadb.config import Settings
         
         settings = Settings(
             anonymized_telemetry=False,
@@ -493,40 +1022,174 @@ class LocalVectorStore:
             self.client = chromadb.EphemeralClient(settings=settings)
             logger.info("Using ephemeral storage")
         
+        # An explicit cache_dir lets ephemeral stores reuse embeddings across runs
+        cache_dir = cache_dir or persist_directory
+        if cache_dir:
+            os.makedirs(cache_dir, exist_ok=True)
+            # Backends differ in precision (int8, fp16), so each keeps its own vectors
+            self.embedding_cache = EmbeddingCache(
+                os.path.join(cache_dir, "embedding_cache.sqlite3"),
+                f"{embedding_model}|{embedding_backend}",
+                near_duplicate_bits=near_duplicate_bits
+            )
+        else:
+            self.embedding_cache = None
+        
         self.collection = self.client.get_or_create_collection(
             name=collection_name,
             metadata={"hnsw:space": "cosine"}
         )
+        
+        self.query_cache = QueryCache(query_cache_size) if query_cache_size > 0 else None
+    
+    @property
+    def embedder(self) -> "SentenceTransformer":
+        """Embedding model, loaded on first access."""
+        if self._embedder is None:
+            with self._embedder_lock:
+                if self._embedder is None:
+                    self._embedder = self._load_embedder()
+        return self._embedder
+    
+    def _load_embedder(self) -> "SentenceTransformer":
+        """Load the embedding model, falling back to torch if the backend is unavailable."""
+        from sentence_transformers import SentenceTransformer
+        
+        logger.info(
+            f"Loading embedding model: {self.embedding_model} "
+            f"({self.embedding_backend} backend)"
+        )
+        if self.embedding_backend != "torch":
+            try:
+                backend, model_kwargs = self._BACKENDS[self.embedding_backend]
+                return SentenceTransformer(
+                    self.embedding_model,
+                    backend=backend,
+                    model_kwargs=model_kwargs
+                )
+            except (KeyError, TypeError, ValueError, ImportError, OSError) as e:
+                # TypeError: sentence-transformers < 3.2 has no backend argument
+                # OSError: quantized model file not published/downloaded
+                logger.warning(
+                    f"Embedding backend '{self.embedding_backend}' unavailable, "
+                    f"using torch: {e}"
+                )
+        
+        # sentence-transformers already picks CUDA when present; fp16 weights
+        # let it use tensor cores, and vectors are cached as float16 anyway
+        model = SentenceTransformer(self.embedding_model)
+        if model.device.type == "cuda":
+            model.half()
+            logger.info("Embedding model running on CUDA in float16")
+        return model
+    
+    @property
+    def embed_batch_size(self) -> int:
+        """Chunks per encoder forward pass (32 on CPU, 128 on CUDA by default)."""
+        if self._embed_batch_size is None:
+            self._embed_batch_size = 128 if self.embedder.device.type == "cuda" else 32
+        return self._embed_batch_size
     
     def add_chunks(self, chunks: List[DocumentChunk], filename: str):
         """Add document chunks to vector store."""
-        if not chunks:
+        self.add_documents([(chunks, filename)])
+    
+    def add_documents(self, documents: List[Tuple[List[DocumentChunk], str]]):
+        """
+        Add chunks from several documents in one bulk operation.
+        
+        Chunks are embedded and written in micro-batches of at most
+        ``write_batch_size`` (capped by ChromaDB's batch limit), so only one
+        batch of embeddings is resident at a time however large the input.
+        
+        Args:
+            documents: List of (chunks, filename) pairs
+        """
+        pairs = [(c, filename) for chunks, filename in documents for c in chunks]
+        if not pairs:
             return
         
-        ids = [f"{chunks[0].doc_hash}_{c.chunk_index}" for c in chunks]
-        documents = [c.content for c in chunks]
+        # ChromaDB rejects add() calls above its max batch size
+        batch_size = min(self.write_batch_size, self.client.get_max_batch_size())
+        for start in range(0, len(pairs), batch_size):
+            ids, texts, metadatas = [], [], []
+            for c, filename in pairs[start:start + batch_size]:
+                ids.append(f"{c.doc_hash}_{c.chunk_index}")
+                texts.append(c.content)
+                metadatas.append({
+                    **c.metadata,
+                    "filename": filename,
+                    "doc_hash": c.doc_hash,
+                    "chunk_index": c.chunk_index
+                })
+            
+            self.collection.add(
+                ids=ids,
+                documents=texts,
+                embeddings=self._embed(texts),
+                metadatas=metadatas
+            )
         
-        logger.info(f"Embedding {len(chunks)} chunks...")
-        embeddings = self.embedder.encode(documents, show_progress_bar=True).tolist()
+        if self.query_cache is not None:
+            self.query_cache.clear()
         
-        metadatas = [
-            {
-                **c.metadata,
-                "filename": filename,
-                "doc_hash": c.doc_hash,
-                "chunk_index": c.chunk_index
-            }
-            for c in chunks
-        ]
+        if len(documents) == 1:
+            logger.info(f"Added {len(pairs)} chunks from {documents[0][1]}")
+        else:
+            logger.info(f"Added {len(pairs)} chunks from {len(documents)} documents")
+    
+    def _embed(self, texts: List[str]) -> np.ndarray:
+        """
+        Embed texts, encoding each distinct text only once.
         
-        self.collection.add(
-            ids=ids,
-            documents=documents,
-            embeddings=embeddings,
-            metadatas=metadatas
+        Repeated headers, footers and disclaimers produce identical chunks;
+        their vectors are computed once and fanned back out by position.
+        """
+        unique = list(dict.fromkeys(texts))
+        if len(unique) == len(texts):
+            return self._embed_unique(texts)
+        
+        position = {text: i for i, text in enumerate(unique)}
+        return self._embed_unique(unique)[[position[t] for t in texts]]
+    
+    def _embed_unique(self, texts: List[str]) -> np.ndarray:
+        """
+        Embed texts, reusing cached vectors and encoding only the misses.
+        
+        Vectors are L2-normalized so cosine distance reduces to a dot
+        product and cached float16 copies stay within a unit range.
+        """
+        # tqdm redraws stderr on every encoder batch; only worth it when debugging
+        show_progress = logger.isEnabledFor(logging.DEBUG)
+        
+        if self.embedding_cache is None:
+            logger.debug(f"Embedding {len(texts)} chunks...")
+            return self._encode(texts, show_progress)
+        
+        vectors = self.embedding_cache.lookup(texts)
+        misses = [i for i, v in enumerate(vectors) if v is None]
+        logger.debug(
+            f"Embedding {len(misses)} chunks "
+            f"({len(texts) - len(misses)} cached)..."
         )
         
-        logger.info(f"Added {len(chunks)} chunks from {filename}")
+        if misses:
+            miss_texts = [texts[i] for i in misses]
+            fresh = self._encode(miss_texts, show_progress)
+            self.embedding_cache.store(miss_texts, fresh)
+            for i, vec in zip(misses, fresh):
+                vectors[i] = vec
+        
+        return np.vstack(vectors).astype(np.float32, copy=False)
+    
+    def _encode(self, texts: List[str], show_progress: bool = False) -> np.ndarray:
+        """Encode texts to L2-normalized float32 vectors (fp16 models included)."""
+        return self.embedder.encode(
+            texts,
+            batch_size=self.embed_batch_size,
+            show_progress_bar=show_progress,
+            normalize_embeddings=True
+        ).astype(np.float32, copy=False)
     
     def query(
         self,
@@ -545,60 +1208,124 @@ class LocalVectorStore:
         Returns:
             List of result dicts with content, metadata, distance
         """
-        query_embedding = self.embedder.encode([query_text]).tolist()
+        return self.query_batch([query_text], n_results, filter_doc_hash)[0]
+    
+    def query_batch(
+        self,
+        query_texts: List[str],
+        n_results: int = 5,
+        filter_doc_hash: Optional[str] = None
+    ) -> List[List[Dict]]:
+        """
+        Query for similar chunks for several queries at once.
+        
+        Queries not served by the query cache are encoded in one encoder
+        pass and searched with a single ChromaDB query call.
+        
+        Args:
+            query_texts: Search queries
+            n_results: Number of results to return per query
+            filter_doc_hash: Optionally filter to specific document
+            
+        Returns:
+            One list of result dicts (content, metadata, distance) per query,
+            in the order of query_texts
+        """
+        hits: List[Optional[List[Dict]]] = [None] * len(query_texts)
+        keys = [(text, n_results, filter_doc_hash) for text in query_texts]
+        
+        if self.query_cache is not None:
+            for i, key in enumerate(keys):
+                hits[i] = self.query_cache.get(key)
+        
+        pending = [i for i, h in enumerate(hits) if h is None]
+        if not pending:
+            return hits
+        
+        embeddings = self._encode([query_texts[i] for i in pending])
+        
+        if self.query_cache is not None:
+            for i, emb in zip(pending, embeddings):
+                hits[i] = self.query_cache.get_similar(keys[i], emb)
+            remaining = [n for n, i in enumerate(pending) if hits[i] is None]
+            pending = [pending[n] for n in remaining]
+            embeddings = embeddings[remaining]
+            if not pending:
+                return hits
         
         where_filter = {"doc_hash": filter_doc_hash} if filter_doc_hash else None
         
         results = self.collection.query(
-            query_embeddings=query_embedding,
+            query_embeddings=embeddings,
             n_results=n_results,
             where=where_filter,
             include=["documents", "metadatas", "distances"]
         )
         
-        if not results["documents"] or not results["documents"][0]:
-            return []
-        
-        return [
-            {
-                "content": doc,
-                "metadata": meta,
-                "distance": dist,
-                "relevance_score": 1 - dist  # Convert distance to similarity
-            }
-            for doc, meta, dist in zip(
-                results["documents"][0],
-                results["metadatas"][0],
-                results["distances"][0]
-            )
-        ]
+        for n, i in enumerate(pending):
+            if not results["documents"] or not results["documents"][n]:
+                hits[i] = []
+            else:
+                hits[i] = [
+                    {
+                        "content": doc,
+                        "metadata": meta,
+                        "distance": dist,
+                        "relevance_score": 1 - dist  # Convert distance to similarity
+                    }
+                    for doc, meta, dist in zip(
+                        results["documents"][n],
+                        results["metadatas"][n],
+                        results["distances"][n]
+                    )
+                ]
+            if self.query_cache is not None:
+                self.query_cache.put(keys[i], embeddings[n], hits[i])
+        
+        return hits
     
     def delete_document(self, doc_hash: str):
         """Delete all chunks for a document."""
         self.collection.delete(where={"doc_hash": doc_hash})
+        if self.query_cache is not None:
+            self.query_cache.clear()
         logger.info(f"Deleted document: {doc_hash}")
     
     def get_document_count(self) -> int:
         """Get total number of chunks in store."""
         return self.collection.count()
     
-    def list_documents(self) -> List[Dict]:
-        """List all unique documents in store."""
-        # Get all metadata
-        results = self.collection.get(include=["metadatas"])
-        
-        if not results["metadatas"]:
-            return []
+    def list_documents(self, page_size: int = 10_000) -> List[Dict]:
+        """
+        List all unique documents in store.
         
-        # Deduplicate by doc_hash
+        Metadata is read in pages so peak memory stays bounded by page_size
+        rather than by the number of chunks in the collection.
+        """
         docs = {}
-        for meta in results["metadatas"]:
-            doc_hash = meta.get("doc_hash")
-            if doc_hash and doc_hash not in docs:
-                docs[doc_hash] = {
-                    "doc_hash": doc_hash,
-                    "filename": meta.get("filename", "unknown")
-                }
+        offset = 0
+        while True:
+            results = self.collection.get(
+                include=["metadatas"],
+                limit=page_size,
+                offset=offset
+            )
+            metadatas = results["metadatas"]
+            if not metadatas:
+                break
+            
+            # Deduplicate by doc_hash
+            for meta in metadatas:
+                doc_hash = meta.get("doc_hash")
+                if doc_hash and doc_hash not in docs:
+                    docs[doc_hash] = {
+                        "doc_hash": doc_hash,
+                        "filename": meta.get("filename", "unknown")
+                    }
+            
+            if len(metadatas) < page_size:
+                break
+            offset += page_size
         
         return list(docs.values())
 
@@ -615,13 +1342,29 @@ class DocumentProcessor:
         context = processor.get_context("What does this say about X?")
     """
     
+    _TYPE_MAP = {
+        '.pdf': DocumentType.PDF,
+        '.docx': DocumentType.DOCX,
+        '.doc': DocumentType.DOC,
+        '.xlsx': DocumentType.XLSX,
+        '.xls': DocumentType.XLSX,
+        '.txt': DocumentType.TXT,
+        '.md': DocumentType.TXT,
+        '.csv': DocumentType.TXT,
+    }
+    
     def __init__(
         self,
         persist_directory: Optional[str] = None,
         tesseract_path: Optional[str] = None,
         embedding_model: str = "all-MiniLM-L6-v2",
         chunk_size: int = 1000,
-        chunk_overlap: int = 100
+        chunk_overlap: int = 100,
+        embed_batch_size: Optional[int] = None,
+        store_batch_size: int = 1000,
+        near_duplicate_bits: int = 0,
+        embedding_backend: str = "torch",
+        embedding_cache_dir: Optional[str] = None
     ):
         """
         Initialize document processor.
@@ -632,7 +1375,16 @@ class DocumentProcessor:
             embedding_model: sentence-transformers model for embeddings
             chunk_size: Target tokens per chunk
             chunk_overlap: Overlap tokens between chunks
+            embed_batch_size: Chunks per encoder forward pass (None = auto)
+            store_batch_size: Deferred chunks buffered before an automatic flush
+            near_duplicate_bits: SimHash distance for reusing embeddings of
+                                 near-identical chunks (0 = off)
+            embedding_backend: "torch", "onnx", "onnx-int8" or "openvino"
+                               (falls back to torch if unavailable)
+            embedding_cache_dir: Embedding cache location
+                                 (None = persist_directory)
         """
+        self.tesseract_path = tesseract_path
         self.extractor = DocumentExtractor(tesseract_path=tesseract_path)
         self.chunker = SemanticChunker(
             chunk_size=chunk_size,
@@ -640,9 +1392,25 @@ class DocumentProcessor:
         )
         self.vector_store = LocalVectorStore(
             persist_directory=persist_directory,
-            embedding_model=embedding_model
+            embedding_model=embedding_model,
+            embed_batch_size=embed_batch_size,
+            near_duplicate_bits=near_duplicate_bits,
+            embedding_backend=embedding_backend,
+            cache_dir=embedding_cache_dir
         )
         self.processed_docs: Dict[str, ProcessedDocument] = {}
+        
+        # Chunks from ingest(defer_store=True) awaiting a bulk write
+        self.store_batch_size = store_batch_size
+        self._pending_store: List[Tuple[List[DocumentChunk], str]] = []
+        self._pending_chunk_count = 0
+        self._store_lock = threading.Lock()
+        
+        # Extraction worker processes, spawned on first parallel ingest and
+        # kept across batches (see close())
+        self._extract_pool: Optional[ProcessPoolExecutor] = None
+        self._extract_pool_size = 0
+        self._extract_pool_lock = threading.Lock()
     
     def _compute_hash(self, file_path: Path) -> str:
         """Compute unique hash for file content."""
@@ -653,44 +1421,42 @@ class DocumentProcessor:
         return hasher.hexdigest()[:16]
     
     def _detect_type(self, path: Path) -> DocumentType:
-        """Detect document type from extension."""
+        """Detect document type from extension (and content, for .doc)."""
         suffix = path.suffix.lower()
+        if suffix == '.doc':
+            suffix = DocumentExtractor.sniff_suffix(path) or suffix
         
-        type_map = {
-            '.pdf': DocumentType.PDF,
-            '.docx': DocumentType.DOCX,
-            '.doc': DocumentType.DOC,
-            '.xlsx': DocumentType.XLSX,
-            '.xls': DocumentType.XLSX,
-            '.txt': DocumentType.TXT,
-            '.md': DocumentType.TXT,
-            '.csv': DocumentType.TXT,
-        }
-        
-        if suffix in type_map:
-            return type_map[suffix]
+        if suffix in self._TYPE_MAP:
+            return self._TYPE_MAP[suffix]
         elif suffix in DocumentExtractor.SUPPORTED_IMAGES:
             return DocumentType.IMAGE
         else:
             return DocumentType.UNKNOWN
     
-    def ingest(self, file_path: Union[str, Path], force: bool = False) -> ProcessedDocument:
+    def ingest(
+        self,
+        file_path: Union[str, Path],
+        force: bool = False,
+        defer_store: bool = False
+    ) -> ProcessedDocument:
         """
         Ingest and index a document.
         
         Args:
             file_path: Path to document
             force: Re-process even if already indexed
+            defer_store: Buffer chunks for a later bulk write (see flush())
             
         Returns:
             ProcessedDocument with metadata including OCR info
         """
         path = Path(file_path).resolve()
         
-        if not path.exists():
-            raise FileNotFoundError(f"Document not found: {path}")
-        
-        doc_hash = self._compute_hash(path)
+        # Hashing opens the file anyway; no separate exists() stat
+        try:
+            doc_hash = self._compute_hash(path)
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Document not found: {path}") from None
         
         # Skip if already processed (unless forced)
         if not force and doc_hash in self.processed_docs:
@@ -702,6 +1468,20 @@ class DocumentProcessor:
         # Extract text (now returns OCR metadata)
         raw_text, ocr_used, ocr_pages = self.extractor.extract(path)
         
+        return self._index_extracted(
+            path, doc_hash, raw_text, ocr_used, ocr_pages, defer_store
+        )
+    
+    def _index_extracted(
+        self,
+        path: Path,
+        doc_hash: str,
+        raw_text: str,
+        ocr_used: bool,
+        ocr_pages: int,
+        defer_store: bool = False
+    ) -> ProcessedDocument:
+        """Chunk and store already-extracted text, then record the document."""
         if ocr_used:
             logger.info(f"OCR applied to {path.name}: {ocr_pages} page(s)")
         
@@ -723,11 +1503,28 @@ class DocumentProcessor:
             ocr_pages=ocr_pages
         )
         
-        # Store in vector DB
-        if chunks:
-            self.vector_store.add_chunks(chunks, path.name)
-        
-        self.processed_docs[doc_hash] = processed
+        # Store in vector DB (deferred chunks are recorded now, written on flush)
+        if chunks and defer_store:
+            self.processed_docs[doc_hash] = processed
+            with self._store_lock:
+                # Re-ingesting identical content (force, or a copy under another
+                # name) must not queue its chunk ids twice: ChromaDB rejects an
+                # add() with duplicate ids, failing the whole flush
+                for i, (queued, _) in enumerate(self._pending_store):
+                    if queued[0].doc_hash == doc_hash:
+                        self._pending_chunk_count -= len(queued)
+                        self._pending_store[i] = (chunks, path.name)
+                        break
+                else:
+                    self._pending_store.append((chunks, path.name))
+                self._pending_chunk_count += len(chunks)
+                should_flush = self._pending_chunk_count >= self.store_batch_size
+            if should_flush:
+                self.flush()
+        else:
+            if chunks:
+                self.vector_store.add_chunks(chunks, path.name)
+            self.processed_docs[doc_hash] = processed
         
         ocr_info = f", OCR: {ocr_pages} pages" if ocr_used else ""
         logger.info(
@@ -741,7 +1538,8 @@ class DocumentProcessor:
         self,
         directory: Union[str, Path],
         recursive: bool = True,
-        extensions: Optional[set] = None
+        extensions: Optional[set] = None,
+        max_workers: int = 1
     ) -> List[ProcessedDocument]:
         """
         Ingest all supported documents in a directory.
@@ -750,6 +1548,7 @@ class DocumentProcessor:
             directory: Directory path
             recursive: Include subdirectories
             extensions: Filter to specific extensions (None = all supported)
+            max_workers: Extraction processes (1 = sequential, in-process)
             
         Returns:
             List of ProcessedDocument objects
@@ -758,20 +1557,322 @@ class DocumentProcessor:
         if not dir_path.is_dir():
             raise NotADirectoryError(f"Not a directory: {directory}")
         
-        supported = extensions or DocumentExtractor.get_supported_extensions()
-        results = []
+        if extensions:
+            supported = frozenset(extensions)
+        else:
+            supported = DocumentExtractor.get_supported_extensions()
         
+        # Suffix check first: it is free, is_file() costs a stat
         pattern = "**/*" if recursive else "*"
+        file_paths = [
+            file_path for file_path in dir_path.glob(pattern)
+            if file_path.suffix.lower() in supported and file_path.is_file()
+        ]
+        
+        if max_workers > 1 and len(file_paths) > 1:
+            return self._ingest_parallel(file_paths, max_workers)
+        
+        return self._ingest_pipelined(file_paths)
+    
+    def _ingest_pipelined(self, file_paths: List[Path]) -> List[ProcessedDocument]:
+        """
+        Ingest files with extraction overlapped against chunking and storage.
+        
+        A background thread extracts upcoming files into a bounded queue
+        while this thread indexes the previous ones, so the encoder is not
+        idle during PDF parsing/OCR and vice versa (fitz, tesseract and
+        torch all release the GIL for their heavy work).
+        """
+        extracted: queue.Queue = queue.Queue(maxsize=4)
+        stop = threading.Event()
+        done = object()
+        
+        def put(item):
+            while not stop.is_set():
+                try:
+                    extracted.put(item, timeout=0.5)
+                    return
+                except queue.Full:
+                    continue
         
-        for file_path in dir_path.glob(pattern):
-            if file_path.is_file() and file_path.suffix.lower() in supported:
+        def produce():
+            seen = set()
+            try:
+                for file_path in file_paths:
+                    if stop.is_set():
+                        break
+                    path = file_path.resolve()
+                    try:
+                        doc_hash = self._compute_hash(path)
+                        if doc_hash in seen or doc_hash in self.processed_docs:
+                            # Resolved by the consumer once earlier copies are indexed
+                            put((path, doc_hash, None))
+                            continue
+                        seen.add(doc_hash)
+                        logger.info(f"Processing: {path.name}")
+                        put((path, doc_hash, self.extractor.extract(path)))
+                    except Exception as e:
+                        put((path, None, e))
+            finally:
+                put(done)
+        
+        producer = threading.Thread(target=produce, name="doc-extract", daemon=True)
+        producer.start()
+        
+        results = []
+        try:
+            while True:
+                item = extracted.get()
+                if item is done:
+                    break
+                
+                path, doc_hash, extraction = item
+                if isinstance(extraction, Exception):
+                    logger.error(f"Failed to process {path}: {extraction}")
+                    continue
+                
+                try:
+                    if extraction is None:
+                        existing = self.processed_docs.get(doc_hash)
+                        if existing is None:
+                            logger.error(
+                                f"Failed to process {path}: duplicate of a file that failed"
+                            )
+                            continue
+                        logger.info(f"Document already indexed: {path.name}")
+                        results.append(existing)
+                    else:
+                        raw_text, ocr_used, ocr_pages = extraction
+                        results.append(self._index_extracted(
+                            path, doc_hash, raw_text, ocr_used, ocr_pages, defer_store=True
+                        ))
+                except Exception as e:
+                    logger.error(f"Failed to process {path}: {e}")
+        finally:
+            stop.set()
+            producer.join()
+        
+        return self._flush_results(results)
+    
+    @property
+    def pending_chunk_count(self) -> int:
+        """Chunks buffered by ingest(defer_store=True) and not yet flushed."""
+        return self._pending_chunk_count
+    
+    def flush(self) -> int:
+        """
+        Write all deferred chunks to the vector store in one bulk add.
+        
+        If the write fails, the affected documents are dropped from
+        processed_docs so they are not reported as indexed.
+        
+        Returns:
+            Number of chunks written
+        """
+        with self._store_lock:
+            pending = self._pending_store
+            self._pending_store = []
+            self._pending_chunk_count = 0
+        
+        if not pending:
+            return 0
+        
+        try:
+            self.vector_store.add_documents(pending)
+        except Exception:
+            for chunks, _ in pending:
+                self.processed_docs.pop(chunks[0].doc_hash, None)
+            raise
+        
+        return sum(len(chunks) for chunks, _ in pending)
+    
+    def _flush_results(self, results: List[ProcessedDocument]) -> List[ProcessedDocument]:
+        """Flush deferred chunks and drop any results whose write failed."""
+        try:
+            self.flush()
+        except Exception as e:
+            logger.error(f"Failed to store deferred chunks: {e}")
+        return [r for r in results if r.doc_hash in self.processed_docs]
+    
+    def _ingest_parallel(
+        self,
+        file_paths: List[Path],
+        max_workers: int
+    ) -> List[ProcessedDocument]:
+        """Ingest files via iter_ingest_parallel(), then flush in one bulk write."""
+        results = [
+            result for _, result in self.iter_ingest_parallel(file_paths, max_workers)
+            if not isinstance(result, Exception)
+        ]
+        return self._flush_results(results)
+    
+    def iter_ingest_parallel(
+        self,
+        file_paths: List[Union[str, Path]],
+        max_workers: int,
+        force: bool = False
+    ) -> Iterator[Tuple[Union[str, Path], Union[ProcessedDocument, Exception]]]:
+        """
+        Extract files in a process pool, then chunk and index in this process.
+        
+        Extraction (PDF parsing, OCR, DOCX) is CPU-bound and independent per
+        file. The embedding model and vector store stay in the parent, so
+        workers never load them. Uses the spawn start method, which is the
+        only one available on Windows and avoids forking torch/chromadb state.
+        The worker pool is shared across calls, so workers are spawned once
+        per DocumentProcessor rather than per batch.
+        
+        Chunks are stored as with ingest(defer_store=True); call flush() once
+        the results have been consumed.
+        
+        Args:
+            file_paths: Documents to ingest
+            max_workers: Max extraction processes
+            force: Re-process documents that are already indexed
+            
+        Yields:
+            (file_path, ProcessedDocument or the exception that failed it)
+            for every input path, in completion order
+        """
+        pending: Dict[str, List[Union[str, Path]]] = {}
+        
+        for file_path in file_paths:
+            try:
+                doc_hash = self._compute_hash(Path(file_path).resolve())
+            except OSError as e:
+                logger.error(f"Failed to process {file_path}: {e}")
+                yield file_path, e
+                continue
+            
+            if not force and doc_hash in self.processed_docs:
+                logger.info(f"Document already indexed: {Path(file_path).name}")
+                yield file_path, self.processed_docs[doc_hash]
+            else:
+                # Identical files are extracted once and reported per path
+                pending.setdefault(doc_hash, []).append(file_path)
+        
+        if not pending:
+            return
+        
+        workers = min(max_workers, len(pending))
+        logger.info(f"Extracting {len(pending)} files with {workers} worker processes")
+        
+        for doc_hash, paths, extraction in self._extract_in_pool(pending.items(), workers):
+            path = Path(paths[0]).resolve()
+            try:
+                if isinstance(extraction, Exception):
+                    raise extraction
+                raw_text, ocr_used, ocr_pages = extraction
+                result = self._index_extracted(
+                    path, doc_hash, raw_text, ocr_used, ocr_pages, defer_store=True
+                )
+            except Exception as e:
+                logger.error(f"Failed to process {path}: {e}")
+                result = e
+            
+            for file_path in paths:
+                yield file_path, result
+    
+    def _get_extract_pool(self, workers: int) -> Tuple[ProcessPoolExecutor, int]:
+        """
+        Return the shared extraction pool and its size, creating it if needed.
+        
+        Spawned workers start on demand, so sizing the pool to the core count
+        costs nothing until that many tasks are in flight at once.
+        """
+        with self._extract_pool_lock:
+            if self._extract_pool is None:
+                self._extract_pool_size = max(workers, os.cpu_count() or 1)
+                self._extract_pool = ProcessPoolExecutor(
+                    max_workers=self._extract_pool_size,
+                    mp_context=multiprocessing.get_context("spawn"),
+                    initializer=_init_extract_worker
+                )
+            return self._extract_pool, self._extract_pool_size
+    
+    def _discard_extract_pool(self, pool: ProcessPoolExecutor):
+        """Drop a broken pool so the next caller gets a fresh one."""
+        with self._extract_pool_lock:
+            if self._extract_pool is pool:
+                self._extract_pool = None
+        pool.shutdown(wait=False)
+    
+    def _extract_in_pool(
+        self,
+        jobs,
+        workers: int
+    ) -> Iterator[Tuple[str, List[Union[str, Path]], Union[tuple, Exception]]]:
+        """
+        Extract (doc_hash, paths) jobs on the shared pool, at most `workers` at once.
+        
+        A worker that dies (e.g. out of memory during OCR) breaks the pool and
+        every task on it. Those tasks are retried one at a time on a fresh
+        pool, so only the file that kills a worker fails.
+        
+        Yields:
+            (doc_hash, paths, extraction tuple or the exception that failed it)
+        """
+        queued = deque(jobs)
+        crashed = []
+        in_flight: Dict[Future, Tuple[str, list, ProcessPoolExecutor]] = {}
+        
+        while queued or in_flight:
+            pool, pool_size = self._get_extract_pool(workers)
+            while queued and len(in_flight) < min(workers, pool_size):
+                doc_hash, paths = queued.popleft()
                 try:
-                    result = self.ingest(file_path)
-                    results.append(result)
+                    future = pool.submit(
+                        _extract_in_worker,
+                        str(Path(paths[0]).resolve()),
+                        self.tesseract_path
+                    )
+                except BrokenProcessPool:
+                    queued.appendleft((doc_hash, paths))
+                    self._discard_extract_pool(pool)
+                    break
+                in_flight[future] = (doc_hash, paths, pool)
+            
+            if not in_flight:
+                continue
+            
+            done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+            for future in done:
+                doc_hash, paths, used_pool = in_flight.pop(future)
+                try:
+                    extraction = future.result()
+                except BrokenProcessPool:
+                    crashed.append((doc_hash, paths))
+                    self._discard_extract_pool(used_pool)
+                    continue
                 except Exception as e:
-                    logger.error(f"Failed to process {file_path}: {e}")
+                    extraction = e
+                yield doc_hash, paths, extraction
         
-        return results
+        if crashed:
+            logger.warning(
+                f"Extraction worker crashed; retrying {len(crashed)} file(s) one at a time"
+            )
+        for doc_hash, paths in crashed:
+            pool, _ = self._get_extract_pool(workers)
+            try:
+                extraction = pool.submit(
+                    _extract_in_worker,
+                    str(Path(paths[0]).resolve()),
+                    self.tesseract_path
+                ).result()
+            except BrokenProcessPool:
+                self._discard_extract_pool(pool)
+                extraction = RuntimeError("extraction worker crashed on this file")
+            except Exception as e:
+                extraction = e
+            yield doc_hash, paths, extraction
+    
+    def close(self):
+        """Shut down the extraction worker processes, if any were started."""
+        with self._extract_pool_lock:
+            pool, self._extract_pool = self._extract_pool, None
+        if pool is not None:
+            pool.shutdown(wait=True, cancel_futures=True)
     
     def get_context(
         self,
@@ -797,7 +1898,39 @@ class DocumentProcessor:
             n_results=n_chunks,
             filter_doc_hash=doc_hash
         )
+        return self._format_context(results, max_tokens)
+    
+    def get_context_batch(
+        self,
+        queries: List[str],
+        n_chunks: int = 5,
+        max_tokens: int = 8000,
+        doc_hash: Optional[str] = None
+    ) -> List[str]:
+        """
+        Retrieve context for several queries with one batched search.
         
+        All queries are embedded in a single encoder pass and searched with
+        one ChromaDB call (see LocalVectorStore.query_batch).
+        
+        Args:
+            queries: User questions
+            n_chunks: Max chunks to retrieve per query
+            max_tokens: Token budget for each context
+            doc_hash: Optionally filter to specific document
+            
+        Returns:
+            One formatted context string per query, in order
+        """
+        batch_results = self.vector_store.query_batch(
+            queries,
+            n_results=n_chunks,
+            filter_doc_hash=doc_hash
+        )
+        return [self._format_context(results, max_tokens) for results in batch_results]
+    
+    def _format_context(self, results: List[Dict], max_tokens: int) -> str:
+        """Format query results as a source-attributed context block."""
         if not results:
             return ""
         
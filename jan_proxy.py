@@ -96,6 +96,7 @@ class ProxyConfig(BaseModel):
     persist_directory: str = "./jan_doc_store"
     tesseract_path: Optional[str] = None
     embedding_model: str = "all-MiniLM-L6-v2"
+    embedding_backend: str = "torch"     # "onnx"/"onnx-int8"/"openvino" for faster CPU inference
 
     # Context injection settings
     auto_inject: bool = True           # Automatically inject context
@@ -198,7 +199,8 @@ async def startup():
     processor = DocumentProcessor(
         persist_directory=config.persist_directory,
         tesseract_path=config.tesseract_path,
-        embedding_model=config.embedding_model
+        embedding_model=config.embedding_model,
+        embedding_backend=config.embedding_backend
     )
 
     logger.info(f"Document processor ready. Storage: {config.persist_directory}")
@@ -218,6 +220,13 @@ async def startup():
         logger.info("Consciousness pipeline not available")
 
 
+@app.on_event("shutdown")
+async def shutdown():
+    """Stop document extraction worker processes."""
+    if processor is not None:
+        processor.close()
+
+
 # ============================================================================
 # Pydantic Models (OpenAI-compatible)
 # ============================================================================
@@ -1016,7 +1025,11 @@ async def stream_jan_response(url: str, data: dict) -> StreamingResponse:
     """Stream response from Jan server."""
 
     async def generate():
-        logger.info(f"Streaming request to {url} with data: {json.dumps(data, indent=2)}")
+        logger.info(f"Streaming request to {url}")
+        # The payload carries the injected document context; only pretty-print
+        # it when someone is actually debugging
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Streaming request data: {json.dumps(data, indent=2)}")
         async with httpx.AsyncClient(timeout=120.0) as client:
             async with client.stream("POST", url, json=data) as response:
                 if response.status_code != 200:
@@ -1474,6 +1487,11 @@ def main():
         "--embedding-model", type=str, default="all-MiniLM-L6-v2",
         help="Sentence transformer model for embeddings"
     )
+    parser.add_argument(
+        "--embedding-backend", type=str, default="torch",
+        choices=["torch", "onnx", "onnx-int8", "openvino"],
+        help="Inference backend for the embedding model"
+    )
     parser.add_argument(
         "--no-auto-inject", action="store_true",
         help="Disable automatic context injection"
@@ -1494,6 +1512,7 @@ def main():
         persist_directory=args.storage,
         tesseract_path=args.tesseract,
         embedding_model=args.embedding_model,
+        embedding_backend=args.embedding_backend,
         auto_inject=not args.no_auto_inject,
         max_context_tokens=args.max_context_tokens
     )
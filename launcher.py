@@ -10,6 +10,7 @@ import os
 import sys
 import glob
 import ctypes
+import multiprocessing
 import subprocess
 import webbrowser
 import threading
@@ -49,6 +50,7 @@ def load_config():
         'USE_JAN_AI_FOR_CHAT': 'true',
         'STORAGE_DIR': './jan_doc_store',
         'EMBEDDING_MODEL': 'all-MiniLM-L6-v2',
+        'EMBEDDING_BACKEND': 'torch',
         'AUTO_INJECT': 'true',
         'MAX_CONTEXT_TOKENS': '8000',
         'AUTO_OPEN_BROWSER': 'true',
@@ -268,6 +270,7 @@ def main():
         proxy_config.persist_directory = str(storage_dir)
         proxy_config.tesseract_path = tesseract_path
         proxy_config.embedding_model = config['EMBEDDING_MODEL']
+        proxy_config.embedding_backend = config['EMBEDDING_BACKEND']
         proxy_config.auto_inject = config['AUTO_INJECT'].lower() == 'true'
         proxy_config.max_context_tokens = int(config['MAX_CONTEXT_TOKENS'])
 
@@ -320,4 +323,7 @@ def main():
 
 
 if __name__ == "__main__":
+    # Required for process pools in the frozen (PyInstaller) build: spawned
+    # workers re-run this entry point and must not start a second server.
+    multiprocessing.freeze_support()
     main()
@@ -276,6 +276,34 @@ class OCRPostProcessor:
         'rnust': 'must',
     }
 
+    # Patterns are compiled once per process, not looked up on every page
+    _BROKEN_WORD_RE = re.compile(r'(\w+)-\s*\n\s*(\w+)')
+    _PARAGRAPH_BREAK_RE = re.compile(r'\n\n+')
+    _SINGLE_NEWLINE_RE = re.compile(r'(?<!\n)\n(?!\n)')
+    _NEWLINES_RE = re.compile(r'\n+')
+    _SPACES_RE = re.compile(r' +')
+    _SPACE_BEFORE_PUNCT_RE = re.compile(r' +([.,;:!?])')
+    _NO_SPACE_AFTER_PUNCT_RE = re.compile(r'([.,;:!?])([A-Za-z])')
+    _ALPHA_WORD_RE = re.compile(r'^[A-Za-z]+$')
+    _DIGIT_ONE_IN_WORD_RE = re.compile(r'(?<=[a-z])1(?=[a-z])')
+    _ISOLATED_CHAR_RE = re.compile(r'\s[^aAiI\d]\s')
+    _REPEATED_PUNCT_RE = re.compile(r'([.,;:!?])\1+')
+    _SPACE_AFTER_QUOTE_RE = re.compile(r'"\s+')
+    _SPACE_BEFORE_QUOTE_RE = re.compile(r'\s+"')
+    _BLANK_LINES_RE = re.compile(r'\n\n\n+')
+
+    # One alternation over all known word errors, matched case-insensitively
+    _COMMON_WORDS_RE = re.compile(
+        r'\b(?:' + '|'.join(WORD_CORRECTIONS) + r')\b', re.IGNORECASE
+    )
+
+    # Unicode space variants normalized to a plain space
+    _SPACE_TRANSLATION = str.maketrans(dict.fromkeys(
+        '\u00a0\u2000\u2001\u2002\u2003\u2004\u2005\u2006'
+        '\u2007\u2008\u2009\u200a\u202f\u205f',
+        ' '
+    ))
+
     def __init__(
         self,
         fix_broken_words: bool = True,
@@ -343,8 +371,7 @@ class OCRPostProcessor:
         """Fix words broken across lines with hyphens."""
         # Pattern: word- followed by newline and continuation
         # Example: "docu-\nment" -> "document"
-        pattern = r'(\w+)-\s*\n\s*(\w+)'
-        text = re.sub(pattern, r'\1\2', text)
+        text = self._BROKEN_WORD_RE.sub(r'\1\2', text)
 
         # Also handle soft hyphens
         text = text.replace('\u00ad', '')  # Soft hyphen
@@ -355,43 +382,27 @@ class OCRPostProcessor:
 
     def _normalize_whitespace(self, text: str) -> str:
         """Normalize whitespace while preserving paragraph structure."""
-        # Replace various Unicode spaces with regular space
-        space_chars = [
-            '\u00a0',  # Non-breaking space
-            '\u2000',  # En quad
-            '\u2001',  # Em quad
-            '\u2002',  # En space
-            '\u2003',  # Em space
-            '\u2004',  # Three-per-em space
-            '\u2005',  # Four-per-em space
-            '\u2006',  # Six-per-em space
-            '\u2007',  # Figure space
-            '\u2008',  # Punctuation space
-            '\u2009',  # Thin space
-            '\u200a',  # Hair space
-            '\u202f',  # Narrow no-break space
-            '\u205f',  # Medium mathematical space
-        ]
-        for char in space_chars:
-            text = text.replace(char, ' ')
+        # Replace various Unicode spaces (NBSP, en/em/thin/hair spaces, ...)
+        # with a regular space in a single pass
+        text = text.translate(self._SPACE_TRANSLATION)
 
         if self.preserve_paragraphs:
             # Preserve double newlines (paragraph breaks)
-            text = re.sub(r'\n\n+', '\n\n', text)
+            text = self._PARAGRAPH_BREAK_RE.sub('\n\n', text)
             # Single newlines -> space (within paragraph)
-            text = re.sub(r'(?<!\n)\n(?!\n)', ' ', text)
+            text = self._SINGLE_NEWLINE_RE.sub(' ', text)
         else:
             # All newlines -> space
-            text = re.sub(r'\n+', ' ', text)
+            text = self._NEWLINES_RE.sub(' ', text)
 
         # Collapse multiple spaces
-        text = re.sub(r' +', ' ', text)
+        text = self._SPACES_RE.sub(' ', text)
 
         # Remove space before punctuation
-        text = re.sub(r' +([.,;:!?])', r'\1', text)
+        text = self._SPACE_BEFORE_PUNCT_RE.sub(r'\1', text)
 
         # Ensure space after punctuation
-        text = re.sub(r'([.,;:!?])([A-Za-z])', r'\1 \2', text)
+        text = self._NO_SPACE_AFTER_PUNCT_RE.sub(r'\1 \2', text)
 
         return text.strip()
 
@@ -413,9 +424,9 @@ class OCRPostProcessor:
                         fixed_word = fixed_word.replace(wrong, right)
 
             # Fix l/1/I confusions in word context
-            if re.match(r'^[A-Za-z]+$', fixed_word):
+            if self._ALPHA_WORD_RE.match(fixed_word):
                 # 1 in the middle of a word is likely l
-                fixed_word = re.sub(r'(?<=[a-z])1(?=[a-z])', 'l', fixed_word)
+                fixed_word = self._DIGIT_ONE_IN_WORD_RE.sub('l', fixed_word)
                 # | in word is likely l or I
                 fixed_word = fixed_word.replace('|', 'l')
 
@@ -425,29 +436,24 @@ class OCRPostProcessor:
 
     def _fix_common_words(self, text: str) -> str:
         """Fix known common OCR word errors."""
-        # Case-insensitive word replacement
-        for wrong, right in self.WORD_CORRECTIONS.items():
-            # Match as whole word, preserve case
-            pattern = r'\b' + wrong + r'\b'
-            text = re.sub(pattern, right, text, flags=re.IGNORECASE)
-            # Also try with first letter capitalized
-            pattern = r'\b' + wrong.capitalize() + r'\b'
-            text = re.sub(pattern, right.capitalize(), text)
-
-        return text
+        # Case-insensitive whole-word replacement, all words in one pass
+        corrections = self.WORD_CORRECTIONS
+        return self._COMMON_WORDS_RE.sub(
+            lambda m: corrections[m.group().lower()], text
+        )
 
     def _final_cleanup(self, text: str) -> str:
         """Final cleanup pass."""
         # Remove isolated single characters that are likely noise
         # (except common single-letter words: a, I)
-        text = re.sub(r'\s[^aAiI\d]\s', ' ', text)
+        text = self._ISOLATED_CHAR_RE.sub(' ', text)
 
         # Remove repeated punctuation
-        text = re.sub(r'([.,;:!?])\1+', r'\1', text)
+        text = self._REPEATED_PUNCT_RE.sub(r'\1', text)
 
         # Fix spacing around quotes
-        text = re.sub(r'"\s+', '"', text)
-        text = re.sub(r'\s+"', '"', text)
+        text = self._SPACE_AFTER_QUOTE_RE.sub('"', text)
+        text = self._SPACE_BEFORE_QUOTE_RE.sub('"', text)
 
         # Remove leading/trailing whitespace from lines
         lines = text.split('\n')
@@ -455,7 +461,7 @@ class OCRPostProcessor:
         text = '\n'.join(lines)
 
         # Remove empty lines
-        text = re.sub(r'\n\n\n+', '\n\n', text)
+        text = self._BLANK_LINES_RE.sub('\n\n', text)
 
         return text.strip()
 